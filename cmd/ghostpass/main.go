@@ -8,8 +8,6 @@ import (
     "strings"
     "errors"
     "syscall"
-    "io/ioutil"
-    "path/filepath"
 
     "github.com/urfave/cli/v2"
     "github.com/fatih/color"
@@ -24,6 +22,19 @@ const (
 	Description string = "Privacy-First Secrets Management Cryptosystem"
 )
 
+var (
+    // single buffered reader over STDIN shared by all prompts, so consecutive reads don't
+    // drop input that an earlier reader had already buffered
+    stdin = bufio.NewReader(os.Stdin)
+
+    // choices for confirmation prompts, where the first index is the affirmative
+    confirmItems = []string{"Yes", "No"}
+
+    // status message printers, built once rather than per message
+    infoColor = color.New(color.FgWhite).Add(color.Bold)
+    successColor = color.New(color.FgGreen).Add(color.Bold)
+)
+
 
 // Helper for displaying banner. TODO: quiet down if set
 func Banner() {
@@ -58,21 +69,480 @@ func ReadKeyFromStdin() (*memguard.Enclave, error) {
 }
 
 
-func init() {
-    // initialize new workspace directory if not set
-    _ = ghostpass.MakeWorkspace()
+// Helper function to read a line of plaintext input from STDIN after displaying a prompt
+func ReadLine(prompt string) (string, error) {
+    fmt.Print(prompt)
+    text, err := stdin.ReadString('\n')
+    if err != nil {
+        return "", err
+    }
+    return strings.TrimSuffix(text, "\n"), nil
+}
+
+
+// Helper function to ask the user for a yes/no confirmation, checking the selected index
+// rather than comparing against the returned string
+func Confirm(label string) (bool, error) {
+    prompt := promptui.Select{
+        Label: label,
+        Items: confirmItems,
+    }
+    idx, _, err := prompt.Run()
+    if err != nil {
+        return false, err
+    }
+    return idx == 0, nil
+}
+
+
+// Helper function to check if a workspace directory entry is a secret store. Symlinks are accepted
+// along with regular files, since `OpenStore` follows them as well.
+func IsStoreEntry(entry os.DirEntry) bool {
+    mode := entry.Type()
+    if !mode.IsRegular() && mode&os.ModeSymlink == 0 {
+        return false
+    }
+    return strings.HasSuffix(entry.Name(), ghostpass.StoreExt)
+}
+
+
+// Helper for shell completion. When completing the value of `--name`, streams out the names of available
+// secret stores, reading the workspace in small batches rather than materializing the whole listing.
+// Otherwise falls back to the default completion of the command's flags.
+func CompleteStores(c *cli.Context) {
+    // the last argument is always the completion flag itself, so check the one preceding it
+    var prev string
+    if len(os.Args) >= 3 {
+        prev = os.Args[len(os.Args)-2]
+    }
+    if prev != "--name" && prev != "-n" {
+        cli.DefaultCompleteWithFlags(c.Command)(c)
+        return
+    }
+
+    dir, err := os.Open(ghostpass.WorkspacePath())
+    if err != nil {
+        return
+    }
+    defer dir.Close()
+
+    for {
+        entries, err := dir.ReadDir(32)
+        for _, entry := range entries {
+            if IsStoreEntry(entry) {
+                fmt.Fprintln(c.App.Writer, strings.TrimSuffix(entry.Name(), ghostpass.StoreExt))
+            }
+        }
+        if err != nil {
+            return
+        }
+    }
+}
+
+
+// Wraps an action handler that operates on a secret store, validating that its name was specified
+// before dispatching to it.
+func WithStore(action func(c *cli.Context, name string) error) cli.ActionFunc {
+    return func(c *cli.Context) error {
+        name := c.String("name")
+        if name == "" {
+            return errors.New("Name to secret store not specified.")
+        }
+        return action(c, name)
+    }
+}
+
+
+// Action handler: Creates a new secret store given a name and master key
+func InitAction(c *cli.Context, name string) error {
+    infoColor.Printf("\n[*] Initializing new secret store `%s` [*]\n\n", name)
+
+    // read master key and store in buffer safely
+    fmt.Printf("> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Printf("\n\n")
+    if err != nil {
+        return err
+    }
+
+    // create new secret store
+    store, err := ghostpass.InitStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    // commit, writing the empty store to its new path
+    if err := store.CommitStore(); err != nil {
+        return err
+    }
+
+    successColor.Println("[*] Successfully initialized new secret store. [*]")
+    return nil
+}
+
+
+// Action handler: Lists all the secret stores available in the workspace
+func StoresAction(c *cli.Context) error {
+    infoColor.Println("\n[*] Listing all available secret stores [*]\n")
+
+    // read entries along with their cached file types, avoiding a per-file lstat.
+    // A workspace that was never created simply holds no stores.
+    files, err := os.ReadDir(ghostpass.WorkspacePath())
+    if err != nil && !os.IsNotExist(err) {
+        return err
+    }
+
+    // build up the whole listing and emit it with a single write
+    col := color.New(color.Underline).Add(color.Bold)
+    var listing strings.Builder
+    for _, f := range files {
+        if !IsStoreEntry(f) {
+            continue
+        }
+        name := strings.TrimSuffix(f.Name(), ghostpass.StoreExt)
+        listing.WriteString("\t* ")
+        listing.WriteString(col.Sprint(name))
+        listing.WriteString("\n")
+    }
+    listing.WriteString("\n")
+    fmt.Fprint(color.Output, listing.String())
+    return nil
+}
+
+
+// Action handler: Completely nukes a secret store given its name after confirmation
+func DestructAction(c *cli.Context, name string) error {
+    infoColor.Printf("\n[*] Destroying secret store `%s` [*]\n\n", name)
+
+    // read master key for the secret store
+    fmt.Printf("> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Println()
+    if err != nil {
+        return err
+    }
+
+    // open the secret store for deletion
+    store, err := ghostpass.OpenStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    fmt.Println()
+
+    // ask for user confirmation
+    confirmed, err := Confirm("Are you SURE you want to do this? You will NOT be able to go back")
+    if err != nil {
+        return err
+    }
+
+    fmt.Println()
+
+    if !confirmed {
+        fmt.Println("Exiting...")
+        return nil
+    }
+
+    // nuke!
+    if err := store.DestroyStore(); err != nil {
+        return err
+    }
+    successColor.Println("[*] Successfully nuked the secret store! Poof! [*]")
+    return nil
+}
+
+
+// Action handler: Adds a new field to a secret store, overwriting an existing one after confirmation
+func AddAction(c *cli.Context, name string) error {
+    infoColor.Printf("\n[*] Adding field entry to secret store `%s` [*]\n", name)
+
+    // read master key for the secret store
+    fmt.Printf("\n> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Println()
+    if err != nil {
+        return err
+    }
+
+    // open the secret store for adding the new field
+    store, err := ghostpass.OpenStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    // get service if not specified in args
+    service := c.String("service")
+    if service == "" {
+        if service, err = ReadLine("> Service: "); err != nil {
+            return err
+        }
+    }
+
+    // get username if not specified in args
+    username := c.String("username")
+    if username == "" {
+        if username, err = ReadLine("> Username: "); err != nil {
+            return err
+        }
+    }
+
+    // read password for service and store in buffer safely
+    fmt.Printf("> Password for `%s` (will not be echoed): ", service)
+    pwd, err := ReadKeyFromStdin()
+    if err != nil {
+        return err
+    }
+
+    fmt.Printf("\n\n")
+
+    // check if key already exists and warn user of overwrite
+    if store.FieldExists(service) {
+        confirmed, err := Confirm("Field already exists in secret store. Overwrite?")
+        if err != nil {
+            return err
+        }
+
+        if !confirmed {
+            fmt.Println("Exiting...")
+            return nil
+        }
+    }
+
+    // add the new field to the store and error-handle
+    if err := store.AddField(service, username, pwd); err != nil {
+        return err
+    }
+
+    // commit, writing the changes to the persistent store
+    if err := store.CommitStore(); err != nil {
+        return err
+    }
+
+    successColor.Println("[*] Successfully added field to secret store! [*]")
+    return nil
+}
+
+
+// Action handler: Removes a field from a secret store given its service
+func RemoveAction(c *cli.Context, name string) error {
+    infoColor.Printf("\n[*] Removing field entry from secret store `%s` [*]\n", name)
 
+    // read master key for the secret store
+    fmt.Printf("\n> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Println()
+    if err != nil {
+        return err
+    }
+
+    // open the secret store for removing the field
+    store, err := ghostpass.OpenStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    // get service if not specified in args
+    service := c.String("service")
+    if service == "" {
+        if service, err = ReadLine("> Service: "); err != nil {
+            return err
+        }
+    }
+
+    fmt.Println()
+
+    // add the new field to the store and error-handle
+    if err := store.RemoveField(service); err != nil {
+        return err
+    }
+
+    // commit, writing the changes to the persistent store
+    if err := store.CommitStore(); err != nil {
+        return err
+    }
+
+    successColor.Println("[*] Successfully nuked the secret store! Poof! [*]")
+    return nil
+}
+
+
+// Action handler: Decrypts and displays a specific field from a secret store
+func ViewAction(c *cli.Context, name string) error {
+    infoColor.Printf("\n[*] Retrieving field entry from secret store `%s` [*]\n", name)
+
+    // read master key for the secret store
+    fmt.Printf("\n> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Println()
+    if err != nil {
+        return err
+    }
+
+    // open the secret store for adding the new field
+    store, err := ghostpass.OpenStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    // get service if not specified in args
+    service := c.String("service")
+    if service == "" {
+        if service, err = ReadLine("> Service: "); err != nil {
+            return err
+        }
+    }
+    fmt.Println()
+
+    // derive the combo entry from field given the service key
+    combo, err := store.GetField(service)
+    if err != nil {
+        return err
+    }
+
+    // output ascii table
+    table := tablewriter.NewWriter(os.Stdout)
+    table.SetHeader([]string{"Service", "Username", "Password"})
+    table.SetAutoMergeCells(true)
+    table.SetRowLine(true)
+    table.Append(combo)
+    table.Render()
+    return nil
+}
+
+
+// Action handler: Lists all the available fields in a secret store
+func FieldsAction(c *cli.Context, name string) error {
+    infoColor.Printf("\n[*] Retrieving all fields from secret store `%s` [*]\n", name)
+
+    // read master key for the secret store
+    fmt.Printf("\n> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Println()
+    if err != nil {
+        return err
+    }
+
+    // open the secret store for adding the new field
+    store, err := ghostpass.OpenStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    fmt.Println()
+
+    table := tablewriter.NewWriter(os.Stdout)
+    table.SetHeader([]string{"Service"})
+    table.Append(store.GetFields())
+    table.Render()
+    return nil
+}
+
+
+// Action handler: Imports a new secret store given a plainsight corpus
+func ImportAction(c *cli.Context) error {
+    corpus := c.String("corpus")
+    if corpus == "" {
+        return errors.New("No path to corpus provided for plainsight decoding.")
+    }
+
+    // read master key for the secret store
+    fmt.Printf("\n> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    fmt.Println()
+    if err != nil {
+        return err
+    }
+
+    // read data out of corpus file
+    corpusdata, err := os.ReadFile(corpus)
+    if err != nil {
+        return err
+    }
+
+    // recreate secret store given plainsight corpus
+    store, err := ghostpass.Import(masterkey, strings.TrimSpace(string(corpusdata)))
+    if err != nil {
+        return err
+    }
+
+    // commit, writing the changes to the persistent store
+    if err := store.CommitStore(); err != nil {
+        return err
+    }
+
+    successColor.Printf("\n[*] Successfully imported new secret store [*]\n")
+    return nil
+}
+
+
+// Action handler: Exports a secret store into a plainsight corpus for distribution
+func ExportAction(c *cli.Context, name string) error {
+    corpus := c.String("corpus")
+    if corpus == "" {
+        return errors.New("No corpus provided for plainsight encoding.")
+    }
+
+    // if output file name not set, set a default one to cwd
+    outfile := c.String("outfile")
+    if outfile == "" {
+        outfile = "plainsight_" + name + ".out"
+    }
+
+    // read master key for the secret store
+    fmt.Printf("\n> Master Key (will not be echoed): ")
+    masterkey, err := ReadKeyFromStdin()
+    if err != nil {
+        return err
+    }
+
+    // open the secret store for adding the new field
+    store, err := ghostpass.OpenStore(name, masterkey)
+    if err != nil {
+        return err
+    }
+
+    // read data from corpus file
+    corpusdata, err := os.ReadFile(corpus)
+    if err != nil {
+        return err
+    }
+
+    // given the current state the store represents, export it as a plainsight file
+    final, err := store.Export(strings.TrimSpace(string(corpusdata)))
+    if err != nil {
+        return err
+    }
+
+    // write finalized data to output file
+    err = os.WriteFile(outfile, []byte(final), 0644)
+    if err != nil {
+        return err
+    }
+
+    successColor.Printf("\n[*] Successfully wrote plainsight file to `%s` [*]\n", outfile)
+    return nil
+}
+
+
+func init() {
     // install interrupt handler for sudden exist to purge cache
     memguard.CatchInterrupt()
-    defer memguard.Purge()
 }
 
 
 func main() {
-    Banner()
+    // purge any secure memory once we're done
+    defer memguard.Purge()
+
+    // shell completion consumes stdout, so don't clobber it with the banner
+    if os.Args[len(os.Args)-1] != "--generate-bash-completion" {
+        Banner()
+    }
+
     app := &cli.App {
         Name: "ghostpass",
         Usage: Description,
+        EnableBashCompletion: true,
         Commands: []*cli.Command {
             {
                 Name: "init",
@@ -85,66 +555,19 @@ func main() {
                         Aliases: []string{"n"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified")
-                    }
-
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Printf("\n[*] Initializing new secret store `%s` [*]\n\n", name)
-
-                    // read master key and store in buffer safely
-                    fmt.Printf("> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Printf("\n\n")
-                    if err != nil {
-                        return err
-                    }
-
-                    // create new secret store
-                    store, err := ghostpass.InitStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    // commit, writing the empty store to its new path
-                    if err := store.CommitStore(); err != nil {
-                        return err
-                    }
-
-                    col = color.New(color.FgGreen).Add(color.Bold)
-                    col.Println("[*] Successfully initialized new secret store. [*]")
-                    return nil
-                },
+                Action: WithStore(InitAction),
             },
             {
                 Name: "stores",
                 Category: "Initialization",
                 Usage: "List existing secret secret stores",
-                Action: func(c *cli.Context) error {
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Println("\n[*] Listing all available secret stores [*]\n")
-
-                    files, err := ioutil.ReadDir(ghostpass.MakeWorkspace())
-                    if err != nil {
-                        return err
-                    }
-
-                    for _, f := range files {
-                        name := strings.TrimSuffix(f.Name(), filepath.Ext(f.Name()))
-                        col := color.New(color.Underline).Add(color.Bold)
-                        fmt.Printf("\t* ")
-                        col.Println(name)
-                    }
-                    fmt.Println()
-                    return nil
-                },
+                Action: StoresAction,
             },
             {
                 Name: "destruct",
                 Category: "Initialization",
                 Usage: "Completely nuke a secret store given its name",
+                BashComplete: CompleteStores,
                 Flags: []cli.Flag{
                     &cli.StringFlag {
                         Name: "name",
@@ -152,59 +575,13 @@ func main() {
                         Aliases: []string{"n"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified.")
-                    }
-
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Printf("\n[*] Destroying secret store `%s` [*]\n\n", name)
-
-                    // read master key for the secret store
-                    fmt.Printf("> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Println()
-                    if err != nil {
-                        return err
-                    }
-
-                    // open the secret store for deletion
-                    store, err := ghostpass.OpenStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    fmt.Println()
-
-                    // ask for user confirmation
-					prompt := promptui.Select{
-						Label: "Are you SURE you want to do this? You will NOT be able to go back",
-						Items: []string{"Yes", "No"},
-					}
-					_, result, err := prompt.Run()
-					if err != nil {
-                        return err
-					}
-
-                    fmt.Println()
-
-                    if result != "Yes" {
-                        fmt.Println("Exiting...")
-                        return nil
-                    }
-
-                    // nuke!
-                    store.DestroyStore()
-                    col = color.New(color.FgGreen).Add(color.Bold)
-                    col.Println("[*] Successfully nuked the secret store! Poof! [*]")
-                    return nil
-                },
+                Action: WithStore(DestructAction),
             },
             {
                 Name: "add",
                 Category: "Operations",
                 Usage: "Add a new field to the secret store, will overwrite if exists",
+                BashComplete: CompleteStores,
                 Flags: []cli.Flag{
                     &cli.StringFlag {
                         Name: "name",
@@ -222,99 +599,14 @@ func main() {
                         Aliases: []string{"u"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified.")
-                    }
-
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Printf("\n[*] Adding field entry to secret store `%s` [*]\n", name)
-
-                    // read master key for the secret store
-                    fmt.Printf("\n> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Println()
-                    if err != nil {
-                        return err
-                    }
-
-                    // open the secret store for adding the new field
-                    store, err := ghostpass.OpenStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    // get service if not specified in args
-                    service := c.String("service")
-                    if service == "" {
-                        reader := bufio.NewReader(os.Stdin)
-                        fmt.Print("> Service: ")
-                        text, err := reader.ReadString('\n')
-                        if err != nil {
-                            return err
-                        }
-                        service = strings.TrimSuffix(text, "\n")
-                    }
-
-                    // get username if not specified in args
-                    username := c.String("username")
-                    if username == "" {
-                        reader := bufio.NewReader(os.Stdin)
-                        fmt.Print("> Username: ")
-                        text, err := reader.ReadString('\n')
-                        if err != nil {
-                            return err
-                        }
-                        username = strings.TrimSuffix(text, "\n")
-                    }
-
-                    // read password for service and store in buffer safely
-                    fmt.Printf("> Password for `%s` (will not be echoed): ", service)
-                    pwd, err := ReadKeyFromStdin()
-                    if err != nil {
-                        return err
-                    }
-
-                    fmt.Printf("\n\n")
-
-                    // check if key already exists and warn user of overwrite
-                    if store.FieldExists(service) {
-					    prompt := promptui.Select{
-                            Label: "Field already exists in secret store. Overwrite?",
-                            Items: []string{"Yes", "No"},
-					    }
-                        _, result, err := prompt.Run()
-                        if err != nil {
-                            return err
-                        }
-
-                        if result != "Yes" {
-                            fmt.Println("Exiting...")
-                            return nil
-                        }
-                    }
-
-                    // add the new field to the store and error-handle
-                    if err := store.AddField(service, username, pwd); err != nil {
-                        return err
-                    }
-
-                    // commit, writing the changes to the persistent store
-                    if err := store.CommitStore(); err != nil {
-                        return err
-                    }
-
-                    col = color.New(color.FgGreen).Add(color.Bold)
-                    col.Println("[*] Successfully added field to secret store! [*]")
-                    return nil
-                },
+                Action: WithStore(AddAction),
             },
             {
                 Name: "remove",
                 Category: "Operations",
                 Aliases: []string{"rm"},
                 Usage: "Remove a field from the secret store",
+                BashComplete: CompleteStores,
                 Flags: []cli.Flag{
                     &cli.StringFlag{
                         Name: "name",
@@ -327,62 +619,13 @@ func main() {
                         Aliases: []string{"s"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified.")
-                    }
-
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Printf("\n[*] Removing field entry from secret store `%s` [*]\n", name)
-
-                    // read master key for the secret store
-                    fmt.Printf("\n> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Println()
-                    if err != nil {
-                        return err
-                    }
-
-                    // open the secret store for removing the field
-                    store, err := ghostpass.OpenStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    // get service if not specified in args
-                    service := c.String("service")
-                    if service == "" {
-                        reader := bufio.NewReader(os.Stdin)
-                        fmt.Print("> Service: ")
-                        text, err := reader.ReadString('\n')
-                        if err != nil {
-                            return err
-                        }
-                        service = strings.TrimSuffix(text, "\n")
-                    }
-
-                    fmt.Println()
-
-                    // add the new field to the store and error-handle
-                    if err := store.RemoveField(service); err != nil {
-                        return err
-                    }
-
-                    // commit, writing the changes to the persistent store
-                    if err := store.CommitStore(); err != nil {
-                        return err
-                    }
-
-                    col = color.New(color.FgGreen).Add(color.Bold)
-                    col.Println("[*] Successfully nuked the secret store! Poof! [*]")
-                    return nil
-                },
+                Action: WithStore(RemoveAction),
             },
             {
                 Name: "view",
                 Category: "Operations",
                 Usage: "Decrypt and view a specific field from the secret store",
+                BashComplete: CompleteStores,
                 Flags: []cli.Flag{
                     &cli.StringFlag{
                         Name: "name",
@@ -395,62 +638,13 @@ func main() {
                         Aliases: []string{"s"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified.")
-                    }
-
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Printf("\n[*] Retrieving field entry from secret store `%s` [*]\n", name)
-
-                    // read master key for the secret store
-                    fmt.Printf("\n> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Println()
-                    if err != nil {
-                        return err
-                    }
-
-                    // open the secret store for adding the new field
-                    store, err := ghostpass.OpenStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    // get service if not specified in args
-                    service := c.String("service")
-                    if service == "" {
-                        reader := bufio.NewReader(os.Stdin)
-                        fmt.Print("> Service: ")
-                        text, err := reader.ReadString('\n')
-                        if err != nil {
-                            return err
-                        }
-                        service = strings.TrimSuffix(text, "\n")
-                    }
-                    fmt.Println()
-
-                    // derive the combo entry from field given the service key
-                    combo, err := store.GetField(service)
-                    if err != nil {
-                        return err
-                    }
-
-                    // output ascii table
-                    table := tablewriter.NewWriter(os.Stdout)
-                    table.SetHeader([]string{"Service", "Username", "Password"})
-                    table.SetAutoMergeCells(true)
-                    table.SetRowLine(true)
-                    table.Append(combo)
-                    table.Render()
-                    return nil
-                },
+                Action: WithStore(ViewAction),
             },
             {
                 Name: "fields",
                 Category: "Operations",
                 Usage: "List all available fields in a secret store",
+                BashComplete: CompleteStores,
                 Flags: []cli.Flag{
                     &cli.StringFlag{
                         Name: "name",
@@ -458,37 +652,7 @@ func main() {
                         Aliases: []string{"n"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified.")
-                    }
-
-                    col := color.New(color.FgWhite).Add(color.Bold)
-                    col.Printf("\n[*] Retrieving all fields from secret store `%s` [*]\n", name)
-
-                    // read master key for the secret store
-                    fmt.Printf("\n> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Println()
-                    if err != nil {
-                        return err
-                    }
-
-                    // open the secret store for adding the new field
-                    store, err := ghostpass.OpenStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    fmt.Println()
-
-                    table := tablewriter.NewWriter(os.Stdout)
-                    table.SetHeader([]string{"Service"})
-                    table.Append(store.GetFields())
-                    table.Render()
-                    return nil
-                },
+                Action: WithStore(FieldsAction),
             },
             {
                 Name: "import",
@@ -501,46 +665,13 @@ func main() {
                         Aliases: []string{"c"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    corpus := c.String("corpus")
-                    if corpus == "" {
-                        return errors.New("No path to corpus provided for plainsight decoding.")
-                    }
-
-                    // read master key for the secret store
-                    fmt.Printf("\n> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    fmt.Println()
-                    if err != nil {
-                        return err
-                    }
-
-                    // read data out of corpus file
-                    corpusdata, err := ioutil.ReadFile(corpus)
-                    if err != nil {
-                        return err
-                    }
-
-                    // recreate secret store given plainsight corpus
-                    store, err := ghostpass.Import(masterkey, strings.TrimSpace(string(corpusdata)))
-                    if err != nil {
-                        return err
-                    }
-
-                    // commit, writing the changes to the persistent store
-                    if err := store.CommitStore(); err != nil {
-                        return err
-                    }
-
-                    col := color.New(color.FgGreen).Add(color.Bold)
-                    col.Printf("\n[*] Successfully imported new secret store [*]\n")
-                    return nil
-                },
+                Action: ImportAction,
             },
             {
                 Name: "export",
                 Category: "Distribution",
                 Usage: "Generates a plainsight file for distribution from current state",
+                BashComplete: CompleteStores,
                 Flags: []cli.Flag{
                     &cli.StringFlag{
                         Name: "name",
@@ -558,66 +689,15 @@ func main() {
                         Aliases: []string{"o"},
                     },
                 },
-                Action: func(c *cli.Context) error {
-                    name := c.String("name")
-                    if name == "" {
-                        return errors.New("Name to secret store not specified.")
-                    }
-
-                    corpus := c.String("corpus")
-                    if corpus == "" {
-                        return errors.New("No corpus provided for plainsight encoding.")
-                    }
-
-                    // if output file name not set, set a default one to cwd
-                    var outfile string
-                    if c.String("outfile") == "" {
-                        outfile = "plainsight_" + name + ".out"
-                    } else {
-                        outfile = c.String("outfile")
-                    }
-
-                    // read master key for the secret store
-                    fmt.Printf("\n> Master Key (will not be echoed): ")
-                    masterkey, err := ReadKeyFromStdin()
-                    if err != nil {
-                        return err
-                    }
-
-                    // open the secret store for adding the new field
-                    store, err := ghostpass.OpenStore(name, masterkey)
-                    if err != nil {
-                        return err
-                    }
-
-                    // read data from corpus file
-                    corpusdata, err := ioutil.ReadFile(corpus)
-                    if err != nil {
-                        return err
-                    }
-
-                    // given the current state the store represents, export it as a plainsight file
-                    final, err := store.Export(strings.TrimSpace(string(corpusdata)))
-                    if err != nil {
-                        return err
-                    }
-
-                    // write finalized data to output file
-                    err = ioutil.WriteFile(outfile, []byte(final), 0644)
-                    if err != nil {
-                        return err
-                    }
-
-                    col := color.New(color.FgGreen).Add(color.Bold)
-                    col.Printf("\n[*] Successfully wrote plainsight file to `%s` [*]\n", outfile)
-                    return nil
-                },
+                Action: WithStore(ExportAction),
             },
         },
     }
 
     err := app.Run(os.Args)
     if err != nil {
-        log.Fatal(err)
+        // exit safely, since deferred purges are skipped when exiting directly
+        log.Println(err)
+        memguard.SafeExit(1)
     }
 }
@@ -5,6 +5,7 @@ package ghostpass
 import (
 	"bytes"
 	"fmt"
+	"math/bits"
 	"strconv"
 	"strings"
 )
@@ -46,20 +47,26 @@ func BinToData(binstring string) []byte {
 }
 
 // Given a plaintext string corpus and a secret to hide, encode it with zero-width characters by converting serialized input
-// into bitstring, which is then encoded to the plaintext to hide in.
+// into bits, which are then encoded to the plaintext to hide in.
 func EncodeHiddenString(plain string, secret string) string {
 
-	// convert secret string into binary representation
-	binary := DataToBin(secret)
-
-	// use a strings builder to push unicode characters from binary bytearray
+	// use a strings builder to push unicode characters for each bit of the secret, without
+	// materializing an intermediate bitstring. Each zero-width character takes 3 bytes.
 	var corpus strings.Builder
+	corpus.Grow(len(plain) + len(secret)*8*3)
 	corpus.WriteString(plain)
-	for _, b := range binary {
-		if b == 49 { // 1
-			corpus.WriteString(string(ZWJ))
-		} else if b == 48 { // 0
-			corpus.WriteString(string(ZWNJ))
+	for _, val := range secret {
+		// emit most significant bit first, padded to at least a byte as with `DataToBin`
+		n := bits.Len32(uint32(val))
+		if n < 8 {
+			n = 8
+		}
+		for i := n - 1; i >= 0; i-- {
+			if (val>>uint(i))&1 == 1 {
+				corpus.WriteRune(ZWJ)
+			} else {
+				corpus.WriteRune(ZWNJ)
+			}
 		}
 	}
 
@@ -71,17 +78,23 @@ func EncodeHiddenString(plain string, secret string) string {
 // into a compressed form.
 func DecodeHiddenString(corpus string) []byte {
 
-	// iterate through corpus and parse out zero-width unicode chars
-	var binresult []byte
+	// iterate through corpus and pack zero-width unicode chars straight back into bytes,
+	// dropping any trailing partial byte the same way as `BinToData`
+	var res []byte
+	var cur byte
+	var n int
 	for _, b := range corpus {
+		if b != ZWJ && b != ZWNJ {
+			continue
+		}
+		cur <<= 1
 		if b == ZWJ {
-			binresult = append(binresult, byte('1'))
-		} else if b == ZWNJ {
-			binresult = append(binresult, byte('0'))
+			cur |= 1
+		}
+		if n++; n == 8 {
+			res = append(res, cur)
+			cur, n = 0, 0
 		}
 	}
-
-	// decode the bitstring back into a compressed form.
-	res := BinToData(string(binresult))
 	return res
 }
@@ -3,6 +3,7 @@
 package ghostpass
 
 import (
+	"bytes"
 	"errors"
 	"github.com/awnumar/memguard"
 	"strings"
@@ -94,14 +95,16 @@ func (f *Field) RederiveAuthPair(key []byte) error {
 		return err
 	}
 
-	// split by by colon and return substrings
-	creds := strings.Split(string(plaintext), ":")
-	user, pwd := creds[0], creds[1]
+	// split at the first colon in place, without allocating intermediate substrings
+	sep := bytes.IndexByte(plaintext, ':')
+	if sep < 0 {
+		return errors.New("Malformed secret in field")
+	}
 
 	// memguard username and encrypted password
 	// if a key generated by a deniable pair is used, the bogus user and password will be set instead
-	user_enclave := memguard.NewBufferFromBytes([]byte(user))
-	pwd_enclave := memguard.NewBufferFromBytes([]byte(pwd))
+	user_enclave := memguard.NewBufferFromBytes(plaintext[:sep])
+	pwd_enclave := memguard.NewBufferFromBytes(plaintext[sep+1:])
 
 	// we now reinitialize the field with the cleartext username, encrypted password,
 	// and a secret checksum representing their resultant encryption.
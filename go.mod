@@ -1,6 +1,6 @@
 module github.com/ghostpass/ghostpass
 
-go 1.14
+go 1.16
 
 require (
 	github.com/awnumar/memguard v0.22.2
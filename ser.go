@@ -8,25 +8,27 @@ import (
 	"encoding/base64"
 	"encoding/hex"
 	"encoding/json"
-	"io/ioutil"
+	"fmt"
+	"io"
 )
 
 // Helper function that converts a stationary persistent store back into a `SecretStore` for interaction.
 // Putting the store in stationary mode preserves more state than plainsight mode, so not much decryption is needed.
 func StationaryUnmarshal(checksum [32]byte, serialized []byte) (*SecretStore, error) {
 
-	// turn the serialized JSON back into a partially initialized state for a SecretStore
-	var ss struct {
-		Version    int               `json:"version"`
-		StoreState string            `json:"state"`
-		Name       string            `json:"name"`
-		Fields     map[string]*Field `json:"fields"`
-	}
+	// turn the serialized JSON back into a partially initialized `SecretStore` directly, since the
+	// symmetric key is never serialized and the remaining fields mirror what `CommitStore` writes.
+	var ss SecretStore
 	err := json.Unmarshal(serialized, &ss)
 	if err != nil {
 		return nil, err
 	}
 
+	// reject stores written with a different protocol version before decrypting anything
+	if err := checkVersion(ss.Version); err != nil {
+		return nil, err
+	}
+
 	// no need to decrypt service, since this it's not encrypted. We are also
 	// not making a copy since we are just mutating the state of the fields
 	for _, field := range ss.Fields {
@@ -36,14 +38,17 @@ func StationaryUnmarshal(checksum [32]byte, serialized []byte) (*SecretStore, er
 		}
 	}
 
-	// return the SecretStore as if nothing changed
-	return &SecretStore{
-		Version:      ss.Version,
-		StoreState:   ss.StoreState,
-		Name:         ss.Name,
-		SymmetricKey: checksum[:],
-		Fields:       ss.Fields,
-	}, nil
+	// finalize with the symmetric key and return the SecretStore as if nothing changed
+	ss.SymmetricKey = checksum[:]
+	return &ss, nil
+}
+
+// Helper routine that checks if a serialized store's protocol version can be deserialized.
+func checkVersion(version int) error {
+	if version != Version {
+		return fmt.Errorf("Unsupported secret store version %d, expected %d", version, Version)
+	}
+	return nil
 }
 
 // Helper routine that prepares a secret store from an exported plainsight
@@ -64,7 +69,7 @@ func PlainsightUnmarshal(checksum [32]byte, encoded []byte) (*SecretStore, error
 	}
 
 	// parse out serialized JSON plainsight store
-	serialized, err := ioutil.ReadAll(reader)
+	serialized, err := io.ReadAll(reader)
 	if err != nil {
 		return nil, err
 	}
@@ -80,8 +85,13 @@ func PlainsightUnmarshal(checksum [32]byte, encoded []byte) (*SecretStore, error
 		return nil, err
 	}
 
+	// reject stores written with a different protocol version before decrypting anything
+	if err := checkVersion(ss.Version); err != nil {
+		return nil, err
+	}
+
 	// create new semi-unencrypted mapping
-	fields := make(map[string]*Field)
+	fields := make(map[string]*Field, len(ss.Fields))
 
 	for servicekey, secret := range ss.Fields {
 
@@ -92,7 +102,7 @@ func PlainsightUnmarshal(checksum [32]byte, encoded []byte) (*SecretStore, error
 		}
 
 		// decrypt service key if store file was plainsight exported
-		service, err := BoxDecrypt(checksum[:], []byte(dec))
+		service, err := BoxDecrypt(checksum[:], dec)
 		if err != nil {
 			return nil, err
 		}
@@ -105,7 +115,6 @@ func PlainsightUnmarshal(checksum [32]byte, encoded []byte) (*SecretStore, error
 
 		// decomprethe string representation for secrets back into a field
 		fields[string(service)] = field
-		delete(ss.Fields, servicekey)
 	}
 
 	// return the SecretStore as if nothing changed
@@ -126,7 +135,7 @@ func (ss *SecretStore) PlainsightMarshal() ([]byte, error) {
 	// stores a final compressed mapping for the secret store's fields, where
 	// keys are encrypted for indistinguishability and a compressed form of the credential pair
 	// is also created to map against for serialization.
-	encfields := make(map[string][]byte)
+	encfields := make(map[string][]byte, len(ss.Fields))
 
 	// encrypt all the service keys for indistinguishability
 	for service, field := range ss.Fields {
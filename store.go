@@ -8,8 +8,8 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
-	"io/ioutil"
 	"os"
+	"path/filepath"
 
 	"github.com/awnumar/memguard"
 )
@@ -21,22 +21,40 @@ const (
 	// default configuration storage path for secret stores
 	StoragePath string = ".ghostpass"
 
+	// file extension for secret store databases within the workspace
+	StoreExt string = ".gp"
+
 	// represents the state that the store is at where it's residing
 	StoreStationary string = "Stationary"
 	StorePlainsight string = "Plainsight"
 )
 
-// Helper routine to construct path to a ghostpaworkspace for storage
-// if not found in filesystem, and returns name
+// Helper routine that returns the path to the ghostpass workspace without touching the
+// filesystem, for read-only paths that don't need it to exist.
+func WorkspacePath() string {
+	return fmt.Sprintf("%s/%s", os.Getenv("HOME"), StoragePath)
+}
+
+// Helper routine to construct path to a ghostpass workspace for storage
+// if not found in filesystem, and returns name. Creation errors are not reported
+// here, so use `ensureWorkspace` where they need to be handled.
 func MakeWorkspace() string {
-	// get absolute path to ghostpaworkspace
-	storepath := fmt.Sprintf("%s/%s", os.Getenv("HOME"), StoragePath)
+	_ = ensureWorkspace()
+	return WorkspacePath()
+}
 
-	// check if storage path exists, if not, create
-	if _, err := os.Stat(storepath); os.IsNotExist(err) {
-		os.Mkdir(storepath, os.ModePerm)
+// Helper routine that creates the ghostpass workspace directly rather than checking if it
+// exists first, where only an already existing workspace is not treated as an error.
+func ensureWorkspace() error {
+	if err := os.Mkdir(WorkspacePath(), os.ModePerm); err != nil && !os.IsExist(err) {
+		return err
 	}
-	return storepath
+	return nil
+}
+
+// Helper routine to construct the path to a secret store's database within the workspace.
+func StorePath(name string) string {
+	return filepath.Join(WorkspacePath(), name+StoreExt)
 }
 
 // Helper routine to check if a given path exists.
@@ -79,15 +97,17 @@ type SecretStore struct {
 // create a new store if name does not exist, otherwise will read and return the existing one.
 func InitStore(name string, pwd *memguard.Enclave) (*SecretStore, error) {
 
-	// initialize path to database, return empty buffer
-	dbpath := fmt.Sprintf("%s/%s.gp", MakeWorkspace(), name)
-	if PathExists(dbpath) {
-		return nil, errors.New("Credential store already exists")
+	// initialize path to database, creating the workspace if needed, return empty buffer
+	if err := ensureWorkspace(); err != nil {
+		return nil, err
 	}
+	dbpath := StorePath(name)
 
-	// create empty file
-	file, err := os.Create(dbpath)
-	if err != nil {
+	// create empty file exclusively, which also fails if the store already exists
+	file, err := os.OpenFile(dbpath, os.O_RDWR|os.O_CREATE|os.O_EXCL, 0666)
+	if os.IsExist(err) {
+		return nil, errors.New("Credential store already exists")
+	} else if err != nil {
 		return nil, err
 	}
 	file.Close()
@@ -119,16 +139,13 @@ func InitStore(name string, pwd *memguard.Enclave) (*SecretStore, error) {
 // exist or cannot properly read and deserialize the contents of the persistent database.
 func OpenStore(name string, pwd *memguard.Enclave) (*SecretStore, error) {
 
-	// check if store doesn't exist
-	dbpath := fmt.Sprintf("%s/%s.gp", MakeWorkspace(), name)
-	if !PathExists(dbpath) {
+	// given a name to a db, read bytes for serialization in one pass, which also catches if
+	// the store doesn't exist without a separate stat (ie. if no workspace was ever created)
+	dbpath := StorePath(name)
+	data, err := os.ReadFile(dbpath)
+	if os.IsNotExist(err) {
 		return nil, errors.New("Credential store does not exist. Create before opening.")
-	}
-
-	// given a name to a db, create it from the workspace, and read bytes for serialization
-	// open file for reading
-	data, err := ioutil.ReadFile(dbpath)
-	if err != nil {
+	} else if err != nil {
 		return nil, err
 	}
 
@@ -157,28 +174,23 @@ func OpenStore(name string, pwd *memguard.Enclave) (*SecretStore, error) {
 // the path to the file-based database.
 func (ss *SecretStore) DestroyStore() error {
 
-	// construct path to workspace
-	storepath := fmt.Sprintf("%s/%s", os.Getenv("HOME"), StoragePath)
-	dbpath := fmt.Sprintf("%s/%s.gp", storepath, ss.Name)
-
-	// delete the persistent path
-	err := os.Remove(dbpath)
-	if err != nil {
-		return err
-	}
+	// construct path to store within the workspace
+	dbpath := StorePath(ss.Name)
 
-	// golang garbage collection so delete in-memory struct once out of scope, but force it
-	ss = nil
-	return nil
+	// delete the persistent path, the in-memory struct is garbage collected once out of scope
+	return os.Remove(dbpath)
 }
 
 // Commits any changes made to the current state of the existing `SecretStore` back to the
 // file-based database to ensure that operations all persist.
 func (ss *SecretStore) CommitStore() error {
 
-	// construct and open path to secret store
-	storepath := fmt.Sprintf("%s/%s", os.Getenv("HOME"), StoragePath)
-	dbpath := fmt.Sprintf("%s/%s.gp", storepath, ss.Name)
+	// construct and open path to secret store, creating the workspace if this is the
+	// first store being committed (ie. from an import)
+	if err := ensureWorkspace(); err != nil {
+		return err
+	}
+	dbpath := StorePath(ss.Name)
 
 	// serialize structure for writing to file
 	data, err := json.Marshal(ss)
@@ -187,7 +199,7 @@ func (ss *SecretStore) CommitStore() error {
 	}
 
 	// write new state back to the store
-	return ioutil.WriteFile(dbpath, data, 0644)
+	return os.WriteFile(dbpath, data, 0644)
 }
 
 ///////////////////////////////////////////////////////////////////////////////////////
@@ -247,12 +259,11 @@ func (ss *SecretStore) RemoveField(service string) error {
 
 // Given a service name as the key, reveal the contents safely for the given entry.
 func (ss *SecretStore) GetField(service string) ([]string, error) {
-	if !ss.FieldExists(service) {
+	val, ok := ss.Fields[service]
+	if !ok {
 		return nil, errors.New("cannot find entry given the service name provided")
 	}
 
-	val := ss.Fields[service]
-
 	// unseal user and password
 	user, err := val.Username.Open()
 	if err != nil {
@@ -263,19 +274,14 @@ func (ss *SecretStore) GetField(service string) ([]string, error) {
 	if err != nil {
 		return nil, err
 	}
-	pwdstr := pwd.Bytes()
-
-	// concatenate slice with parameters for output
-	var combo []string
-	combo = append(combo, service)
-	combo = append(combo, string(user.Bytes()))
-	combo = append(combo, string(pwdstr))
-	return combo, nil
+
+	// construct slice with parameters for output
+	return []string{service, string(user.Bytes()), string(pwd.Bytes())}, nil
 }
 
 // Return a slice of all available services in the secret store.
 func (ss *SecretStore) GetFields() []string {
-	var fields []string
+	fields := make([]string, 0, len(ss.Fields))
 	for service := range ss.Fields {
 		fields = append(fields, service)
 	}